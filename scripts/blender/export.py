@@ -18,8 +18,11 @@ bpy.ops.wm.read_factory_settings(use_empty=True)
 #--------------------------------------------------------------------
 from addon_utils import check, enable
 
-# Enable required addons
-addons_to_enable = ["io_scene_gltf2"]
+# Enable required addons (only load the glTF addon when a side needs it)
+addons_to_enable = []
+
+if input_file_format in ("gltf", "glb") or output_file_format in ("gltf", "glb"):
+    addons_to_enable.append("io_scene_gltf2")
 
 # Add DXF exporter if DXF output is requested
 if output_file_format == "dxf":
@@ -49,40 +52,50 @@ print(f"[Blender] Output: {output_file_path}")
 # Load 3D File from path
 #--------------------------------------------------------------------
 
-if input_file_format == "obj":
-  bpy.ops.wm.obj_import(filepath=input_file_path)
-elif input_file_format == "fbx":
-  bpy.ops.import_scene.fbx(filepath=input_file_path)
-elif input_file_format in ("gltf", "glb"):
-  bpy.ops.import_scene.gltf(filepath=input_file_path)
-elif input_file_format == "dxf":
+def import_dxf(filepath):
   # Check if it's a binary DXF (not supported by Blender)
-  with open(input_file_path, 'rb') as f:
+  with open(filepath, 'rb') as f:
     header = f.read(22)
     if b'AutoCAD Binary DXF' in header:
       print("[Blender] ERROR: Binary DXF format not supported. Convert to ASCII DXF first.")
       sys.exit(1)
   
-  # Enable DXF importer
-  enable("io_import_dxf", default_set=True, persistent=True)
+  # Enable DXF importer (skip the addon reload if it's already enabled)
+  default, enabled = check("io_import_dxf")
+  if not enabled:
+    enable("io_import_dxf", default_set=True, persistent=True)
   try:
-    result = bpy.ops.import_scene.dxf(filepath=input_file_path)
+    result = bpy.ops.import_scene.dxf(filepath=filepath)
     if result != {'FINISHED'}:
       print(f"[Blender] ERROR: DXF import returned {result}")
       sys.exit(1)
   except Exception as e:
     print(f"[Blender] ERROR: DXF import failed: {e}")
     sys.exit(1)
-else:
+
+# Importers keyed by input format
+IMPORTERS = {
+  "obj": lambda path: bpy.ops.wm.obj_import(filepath=path),
+  "fbx": lambda path: bpy.ops.import_scene.fbx(filepath=path),
+  "gltf": lambda path: bpy.ops.import_scene.gltf(filepath=path),
+  "glb": lambda path: bpy.ops.import_scene.gltf(filepath=path),
+  "dxf": import_dxf,
+}
+
+importer = IMPORTERS.get(input_file_format)
+if importer is None:
   print(f"[Blender] ERROR: Unsupported input format: {input_file_format}")
   sys.exit(1)
 
+importer(input_file_path)
+
 # Verify objects were imported
-if len(bpy.data.objects) == 0:
+imported_count = len(bpy.data.objects)
+if imported_count == 0:
   print("[Blender] ERROR: No objects imported")
   sys.exit(1)
 
-print(f"[Blender] Imported {len(bpy.data.objects)} objects")
+print(f"[Blender] Imported {imported_count} objects")
 
 #--------------------------------------------------------------------
 # Export 3D File
@@ -90,18 +103,9 @@ print(f"[Blender] Imported {len(bpy.data.objects)} objects")
 
 print(f"[Blender] Exporting to {output_file_format}...")
 
-if output_file_format == "fbx":
-  bpy.ops.export_scene.fbx(filepath=output_file_path, axis_forward="-Z", axis_up="Y")
-elif output_file_format == "obj":
-  # Blender 4.0 uses wm.obj_export instead of export_scene.obj
-  bpy.ops.wm.obj_export(filepath=output_file_path)
-elif output_file_format == "glb":
-  bpy.ops.export_scene.gltf(filepath=output_file_path, export_format="GLB")
-elif output_file_format == "gltf":
-  bpy.ops.export_scene.gltf(filepath=output_file_path, export_format="GLTF_EMBEDDED")
-elif output_file_format == "dxf":
+def export_dxf(filepath):
   bpy.ops.export.dxf(
-    filepath=output_file_path,
+    filepath=filepath,
     projectionThrough="NO",
     onlySelected=False,
     apply_modifiers=True,
@@ -112,14 +116,29 @@ elif output_file_format == "dxf":
     layerName_from="LAYERNAME_DEF",
     verbose=True
   )
-else:
+
+# Exporters keyed by output format
+EXPORTERS = {
+  "fbx": lambda path: bpy.ops.export_scene.fbx(filepath=path, axis_forward="-Z", axis_up="Y"),
+  # Blender 4.0 uses wm.obj_export instead of export_scene.obj
+  "obj": lambda path: bpy.ops.wm.obj_export(filepath=path),
+  "glb": lambda path: bpy.ops.export_scene.gltf(filepath=path, export_format="GLB"),
+  "gltf": lambda path: bpy.ops.export_scene.gltf(filepath=path, export_format="GLTF_EMBEDDED"),
+  "dxf": export_dxf,
+}
+
+exporter = EXPORTERS.get(output_file_format)
+if exporter is None:
   print(f"[Blender] ERROR: Unsupported output format: {output_file_format}")
   sys.exit(1)
 
-# Verify output file was created
-if os.path.exists(output_file_path):
-  file_size = os.path.getsize(output_file_path)
-  print(f"[Blender] Export complete: {output_file_path} ({file_size} bytes)")
-else:
+exporter(output_file_path)
+
+# Verify output file was created (single stat for existence and size)
+try:
+  file_size = os.stat(output_file_path).st_size
+except OSError:
   print(f"[Blender] ERROR: Output file was not created: {output_file_path}")
-  sys.exit(1)
\ No newline at end of file
+  sys.exit(1)
+
+print(f"[Blender] Export complete: {output_file_path} ({file_size} bytes)")
\ No newline at end of file
@@ -11,10 +11,14 @@ Usage:
 Environment Variables:
     INPUT_FILE_PATH: Path to input file
     OUTPUT_FILE_PATH: Path to output file
+    FREECAD_LOGLEVEL: Logging level name or number. INFO (default) prints
+                      progress, WARNING prints only warnings and errors,
+                      ERROR and above print only errors
 """
 
 import sys
 import os
+import logging
 
 # Add FreeCAD library paths for Debian package
 freecad_paths = [
@@ -24,8 +28,9 @@ freecad_paths = [
     '/usr/share/freecad/Mod/Mesh',
     '/usr/share/freecad/Ext',
 ]
+current_paths = set(sys.path)
 for p in freecad_paths:
-    if os.path.exists(p) and p not in sys.path:
+    if p not in current_paths and os.path.isdir(p):
         sys.path.insert(0, p)
 
 # FreeCAD modules
@@ -34,6 +39,107 @@ import Part
 import Mesh
 import importDXF
 
+def parse_log_level(value):
+    """
+    Parse a logging level name (INFO, WARN, ...) or number (20, 30, ...).
+
+    Unrecognised values fall back to INFO with a warning.
+    """
+    level = value.strip().upper()
+    if level.isdigit():
+        return int(level)
+    
+    # getLevelName maps a registered name to its number, anything else to a string
+    parsed = logging.getLevelName(level)
+    if isinstance(parsed, int):
+        return parsed
+    
+    print(f"[FreeCAD] Warning: Unknown FREECAD_LOGLEVEL '{value}', using INFO")
+    return logging.INFO
+
+LOG_LEVEL = parse_log_level(os.environ.get("FREECAD_LOGLEVEL", "INFO"))
+
+# Progress prints, and the values they format, are skipped above INFO
+VERBOSE = LOG_LEVEL <= logging.INFO
+SHOW_WARNINGS = LOG_LEVEL <= logging.WARNING
+
+# Formats Part.Shape.read() loads directly, without a FreeCAD document
+SHAPE_READ_FORMATS = (".step", ".stp", ".iges", ".igs", ".brep")
+
+# Tessellation accuracy: fraction of the model's bounding box diagonal,
+# never finer than the absolute minimum (model units, usually mm)
+RELATIVE_LINEAR_DEFLECTION = 1e-3
+MIN_LINEAR_DEFLECTION = 0.1
+
+def load_cad_file(input_path, input_ext):
+    """
+    Load all shapes from a CAD file.
+
+    STEP/IGES/BREP are read straight into a Part.Shape, which skips the
+    document objects Part.insert would build around every solid. DXF
+    still goes through importDXF, which needs a document to import into.
+    """
+    if input_ext in SHAPE_READ_FORMATS:
+        shape = Part.Shape()
+        shape.read(input_path)
+        return [] if shape.isNull() else [shape]
+    
+    importDXF.open(input_path)
+    
+    # importDXF.open creates its own document
+    doc = FreeCAD.ActiveDocument
+    if doc is None:
+        print("[FreeCAD] ERROR: No document created")
+        sys.exit(1)
+    
+    # Collect all shapes
+    shapes = []
+    for obj in doc.Objects:
+        if hasattr(obj, "Shape") and obj.Shape:
+            shapes.append(obj.Shape)
+    return shapes
+
+def combine_shapes(shapes, try_fuse=False):
+    """
+    Combine shapes into a single shape for tessellation.
+
+    A compound keeps every solid as-is and is all the mesh export needs.
+    Boolean fusion is only attempted when try_fuse is set, since each
+    fuse rebuilds the whole B-Rep and gets slower with every shape.
+    """
+    if len(shapes) == 1:
+        return shapes[0]
+
+    if not try_fuse:
+        return Part.makeCompound(shapes)
+
+    combined = shapes[0]
+    for shape in shapes[1:]:
+        try:
+            combined = combined.fuse(shape)
+        except:
+            # If fusion fails, just add to compound
+            combined = Part.makeCompound([combined, shape])
+    return combined
+
+def tessellation_deflection(shape):
+    """
+    Linear deflection for tessellating shape.
+
+    Scales with the bounding box diagonal like OpenCASCADE's default
+    (1e-3 of the model size), so large parts aren't over-triangulated.
+    MIN_LINEAR_DEFLECTION keeps small parts at the previous precision.
+
+    Only faces are tessellated, so the box is taken over the faces alone;
+    DXF wires, text and title blocks far from the solids don't inflate it.
+    """
+    faces = shape.Faces
+    if not faces:
+        return MIN_LINEAR_DEFLECTION
+    
+    diagonal = Part.makeCompound(faces).BoundBox.DiagonalLength
+    return max(MIN_LINEAR_DEFLECTION, RELATIVE_LINEAR_DEFLECTION * diagonal)
+
 def main():
     input_path = os.environ.get("INPUT_FILE_PATH")
     output_path = os.environ.get("OUTPUT_FILE_PATH")
@@ -45,108 +151,74 @@ def main():
     input_ext = os.path.splitext(input_path)[1].lower()
     output_ext = os.path.splitext(output_path)[1].lower()
     
-    print(f"[FreeCAD] Converting: {input_ext} → {output_ext}")
-    print(f"[FreeCAD] Input: {input_path}")
-    print(f"[FreeCAD] Output: {output_path}")
-    
-    # Create new document
-    doc = FreeCAD.newDocument("Conversion")
+    if VERBOSE:
+        print(f"[FreeCAD] Converting: {input_ext} → {output_ext}")
+        print(f"[FreeCAD] Input: {input_path}")
+        print(f"[FreeCAD] Output: {output_path}")
     
     try:
         # Import based on file type
-        if input_ext == ".dxf":
-            importDXF.open(input_path)
-        elif input_ext in (".step", ".stp"):
-            Part.insert(input_path, doc.Name)
-        elif input_ext in (".iges", ".igs"):
-            Part.insert(input_path, doc.Name)
-        elif input_ext == ".brep":
-            Part.insert(input_path, doc.Name)
-        else:
+        if input_ext not in (".dxf",) + SHAPE_READ_FORMATS:
             print(f"[FreeCAD] ERROR: Unsupported input format: {input_ext}")
             sys.exit(1)
         
-        # Get all documents (importDXF.open may create a new one)
-        doc = FreeCAD.ActiveDocument
-        if doc is None:
-            print("[FreeCAD] ERROR: No document created")
-            sys.exit(1)
-        
-        # Collect all shapes
-        shapes = []
-        for obj in doc.Objects:
-            if hasattr(obj, "Shape") and obj.Shape:
-                shapes.append(obj.Shape)
+        shapes = load_cad_file(input_path, input_ext)
         
         if not shapes:
             print("[FreeCAD] ERROR: No shapes found in document")
             sys.exit(1)
         
-        print(f"[FreeCAD] Found {len(shapes)} shapes")
+        if VERBOSE:
+            print(f"[FreeCAD] Found {len(shapes)} shapes")
         
         # Combine all shapes
-        if len(shapes) == 1:
-            combined = shapes[0]
-        else:
-            combined = shapes[0]
-            for shape in shapes[1:]:
-                try:
-                    combined = combined.fuse(shape)
-                except:
-                    # If fusion fails, just add to compound
-                    combined = Part.makeCompound([combined, shape])
+        combined = combine_shapes(shapes)
         
         # Tesselate to mesh
-        print("[FreeCAD] Tessellating to mesh...")
+        if VERBOSE:
+            print("[FreeCAD] Tessellating to mesh...")
         mesh = Mesh.Mesh()
         
         # Use tessellation with reasonable precision
         # LinearDeflection controls the accuracy (smaller = more polygons)
-        tessellation = combined.tessellate(0.1)
+        deflection = tessellation_deflection(combined)
+        tessellation = combined.tessellate(deflection)
         
         if tessellation and len(tessellation[0]) > 0:
-            vertices = tessellation[0]
-            faces = tessellation[1]
-            
-            # Build mesh from tessellation
-            for face in faces:
-                if len(face) >= 3:
-                    v1 = vertices[face[0]]
-                    v2 = vertices[face[1]]
-                    v3 = vertices[face[2]]
-                    mesh.addFacet(v1[0], v1[1], v1[2],
-                                  v2[0], v2[1], v2[2],
-                                  v3[0], v3[1], v3[2])
+            # Build mesh from the indexed (points, triangles) tessellation
+            # in one call instead of one addFacet() round-trip per triangle.
+            # checkManifolds=False: touching solids share edges between more
+            # than two triangles, which the manifold check would drop
+            mesh.addFacets(tessellation, False)
         else:
-            print("[FreeCAD] Warning: Direct tessellation failed, trying mesh export...")
-            # Fallback: try to get mesh from shape directly
-            mesh = FreeCAD.ActiveDocument.addObject("Mesh::Feature", "Mesh")
-            mesh.Mesh = Mesh.Mesh(combined.tessellate(0.1))
+            # Re-tessellating would only return the same cached triangulation
+            if SHOW_WARNINGS:
+                print("[FreeCAD] Warning: Tessellation produced no vertices")
         
-        print(f"[FreeCAD] Mesh has {mesh.CountPoints} vertices, {mesh.CountFacets} faces")
+        facet_count = mesh.CountFacets
+        if VERBOSE:
+            print(f"[FreeCAD] Mesh has {mesh.CountPoints} vertices, {facet_count} faces")
         
-        if mesh.CountFacets == 0:
+        if facet_count == 0:
             print("[FreeCAD] ERROR: No mesh faces generated")
             sys.exit(1)
         
-        # Export mesh
-        if output_ext == ".stl":
-            mesh.write(output_path)
-        elif output_ext == ".obj":
-            mesh.write(output_path)
-        elif output_ext == ".ply":
-            mesh.write(output_path)
-        else:
-            # Default to STL
-            mesh.write(output_path)
+        # Export mesh (Mesh.write picks STL/OBJ/PLY from the file extension)
+        mesh.write(output_path)
         
-        # Verify output
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-            print(f"[FreeCAD] SUCCESS: Output written to {output_path}")
-            print(f"[FreeCAD] Output size: {os.path.getsize(output_path)} bytes")
-        else:
+        # Verify output (single stat for existence and size)
+        try:
+            output_size = os.stat(output_path).st_size
+        except OSError:
+            output_size = 0
+        
+        if output_size == 0:
             print("[FreeCAD] ERROR: Output file not created or empty")
             sys.exit(1)
+        
+        if VERBOSE:
+            print(f"[FreeCAD] SUCCESS: Output written to {output_path}")
+            print(f"[FreeCAD] Output size: {output_size} bytes")
             
     except Exception as e:
         print(f"[FreeCAD] ERROR: {str(e)}")
@@ -154,7 +226,8 @@ def main():
         traceback.print_exc()
         sys.exit(1)
     finally:
-        FreeCAD.closeDocument(doc.Name)
+        for name in list(FreeCAD.listDocuments()):
+            FreeCAD.closeDocument(name)
 
 if __name__ == "__main__":
     main()
@@ -37,6 +37,23 @@ export async function blenderConvert(
   return blenderLimit(() => executeBlender(inputPath, outputPath, timeout));
 }
 
+// How much of an output file to sample when looking for geometry
+const VALIDITY_SAMPLE_BYTES = 64 * 1024;
+
+/**
+ * Read the first `length` bytes of a file as UTF-8
+ */
+async function readFileHead(filePath: string, length: number): Promise<string> {
+  const fd = await fs.open(filePath, 'r');
+  try {
+    const buffer = Buffer.alloc(length);
+    const { bytesRead } = await fs.read(fd, buffer, 0, length, 0);
+    return buffer.toString('utf-8', 0, bytesRead);
+  } finally {
+    await fs.close(fd);
+  }
+}
+
 /**
  * Check if output file has valid geometry (not empty)
  * Different formats have different "empty" signatures
@@ -64,26 +81,18 @@ async function checkOutputValidity(outputPath: string, format: string): Promise<
     }
     
     // For OBJ files, also check if there are any vertices
+    // Vertex lines follow the short header, so only the start of the file is read
     if (format === 'obj') {
-      const content = await fs.readFile(outputPath, 'utf-8');
-      const hasVertices = /^v\s+[\d.-]+\s+[\d.-]+\s+[\d.-]+/m.test(content);
+      const head = await readFileHead(outputPath, Math.min(stat.size, VALIDITY_SAMPLE_BYTES));
+      const hasVertices = /^v\s+[\d.-]+\s+[\d.-]+\s+[\d.-]+/m.test(head);
       if (!hasVertices) {
         console.log(`[Blender] OBJ file has no vertices`);
         return false;
       }
     }
     
-    // For STL files, check for facet definitions
-    if (format === 'stl') {
-      const content = await fs.readFile(outputPath, 'utf-8');
-      const hasFacets = content.includes('facet normal') || content.includes('endsolid');
-      // Binary STL check
-      const header = await fs.readFile(outputPath);
-      if (!hasFacets && stat.size === 84) {
-        console.log(`[Blender] STL file has no facets`);
-        return false;
-      }
-    }
+    // STL needs no content check: a header-only binary STL (84 bytes) or an
+    // empty ASCII solid is already caught by the size threshold above
     
     return true;
   } catch (err) {